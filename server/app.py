@@ -1,9 +1,22 @@
 import contextlib
 
 from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
 
+from server.config import CORS_ORIGINS
+from server.data import shared_state
 from server.mcp_server import create_mcp_server
 from server.middleware.cors import add_cors
+from server.routes.widget import add_widget_route
+
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+async def health(request: Request) -> Response:
+    # Plain Starlette route: no dependency resolution or response validation,
+    # and async so it is not dispatched to the threadpool
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 def create_app() -> FastAPI:
@@ -11,15 +24,19 @@ def create_app() -> FastAPI:
 
     @contextlib.asynccontextmanager
     async def lifespan(app: FastAPI):
-        async with mcp.session_manager.run():
-            yield
+        if shared_state.USE_REDIS:
+            await shared_state.connect()
+        try:
+            async with mcp.session_manager.run():
+                yield
+        finally:
+            await shared_state.close()
 
     app = FastAPI(title="Goal Tracker MCP", lifespan=lifespan)
-    add_cors(app)
+    add_cors(app, CORS_ORIGINS)
 
-    @app.get("/health")
-    def health():
-        return {"status": "ok"}
+    app.add_route("/health", health, methods=["GET"], include_in_schema=False)
+    add_widget_route(app)
 
     app.mount("/", mcp.streamable_http_app())
 
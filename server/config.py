@@ -1,4 +1,32 @@
 import os
+from typing import List
+
+
+def split_env_list(value: str | None) -> List[str]:
+    """Split comma-separated environment variable into list."""
+    if not value:
+        return []
+    return list(filter(None, map(str.strip, value.split(","))))
+
 
 PORT = int(os.environ.get("PORT", 8787))
 BASE_URL = os.environ.get("BASE_URL", f"http://localhost:{PORT}")
+# Explicit origins let CORSMiddleware skip the wildcard path; "*" if unset
+CORS_ORIGINS = split_env_list(os.environ.get("CORS_ORIGINS")) or ["*"]
+# Only used to pick how the server is run and to reject unsafe setups;
+# uvicorn reads WEB_CONCURRENCY itself when no worker count is given
+WORKERS = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# "memory" keeps state per process; "redis" shares it across workers
+STATE_BACKEND = os.environ.get("STATE_BACKEND", "memory")
+if STATE_BACKEND not in ("memory", "redis"):
+    raise ValueError(
+        f"STATE_BACKEND must be 'memory' or 'redis', got {STATE_BACKEND!r}"
+    )
+# In-memory state is per process, so a session started on one worker would be
+# unknown to the others
+if WORKERS > 1 and STATE_BACKEND != "redis":
+    raise ValueError("WEB_CONCURRENCY > 1 requires STATE_BACKEND=redis")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+# Idle onboarding sessions expire from Redis after this many seconds
+SESSION_TTL = int(os.environ.get("SESSION_TTL", 3600))
@@ -1,15 +1,24 @@
 """Onboarding state management for goal-setting questionnaire.
 
 This module manages the state for an onboarding flow where users answer 3 Y/N
-questions about their goal-setting preferences. State is stored in-memory
-and will be replaced with persistent storage later.
+questions about their goal-setting preferences. Sessions live in a
+SessionStore: in-memory by default, or in Redis when ``STATE_BACKEND=redis``
+so that sessions survive restarts and any worker can continue a session
+started on another one. Session store access is async; the in-memory path
+never blocks the event loop.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from uuid import uuid4
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import urandom
+from typing import Dict, List, Mapping, Optional, Protocol, Tuple
+
+import orjson
+
+from server.config import SESSION_TTL
+from server.data.shared_state import USE_REDIS, get_client
 
 
 # Onboarding questions (Y/N format)
@@ -20,33 +29,168 @@ ONBOARDING_QUESTIONS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class OnboardingState:
-    """Represents the state of an onboarding session."""
+    """Represents the state of an onboarding session.
+
+    Fields are stored in slots, so there is no per-instance __dict__.
+    """
 
     session_id: str
-    current_question: int = 0  # 0, 1, 2, or 3 (completed)
-    answers: List[bool] = field(default_factory=list)  # Y=True, N=False
+    current_question: int = 0  # 0, 1, 2, or 3 (completed); also the answer count
+    answers: int = 0  # bit i set = Yes (Y) to question i
     completed: bool = False
 
+    @property
+    def answer_list(self) -> List[bool]:
+        """The recorded answers in question order (Y=True, N=False)."""
+        return [bool(self.answers >> i & 1) for i in range(self.current_question)]
+
+
+# Sessions use the same JSON codec as the goal state (orjson serializes
+# dataclasses natively)
+_encode_state = orjson.dumps
+
+
+def _decode_state(raw: bytes) -> OnboardingState:
+    return OnboardingState(**orjson.loads(raw))
+
+
+def _apply_answer(session: OnboardingState, answer: bool) -> None:
+    """Record an answer on a session in place and advance to the next question.
+
+    Completed sessions are left unchanged. _RECORD_ANSWER_LUA must stay in sync
+    with this; tests/test_session_stores.py checks that the two agree.
+    """
+    if session.completed:
+        return
+    session.answers |= answer << session.current_question
+    session.current_question += 1
+    if session.current_question >= len(ONBOARDING_QUESTIONS):
+        session.completed = True
+
 
-# In-memory store for onboarding sessions
-_sessions: Dict[str, OnboardingState] = {}
+class SessionStore(Protocol):
+    """Storage backend for onboarding sessions."""
+
+    async def create(self, session: OnboardingState) -> None: ...
+
+    async def get(self, session_id: str) -> Optional[OnboardingState]: ...
+
+    async def record_answer(
+        self, session: OnboardingState, answer: bool
+    ) -> Optional[OnboardingState]: ...
+
+    async def delete(self, session_id: str) -> Optional[OnboardingState]: ...
+
+
+class InMemorySessionStore:
+    """Per-process session store, kept in LRU order and capped in size.
+
+    The cap stops abandoned sessions from growing the store without bound.
+    Sessions are mutated in place, so recording an answer needs no write back.
+    """
+
+    def __init__(self, max_sessions: int = 10_000) -> None:
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str, OnboardingState] = OrderedDict()
+
+    async def create(self, session: OnboardingState) -> None:
+        self._sessions[session.session_id] = session
+        if len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+
+    async def get(self, session_id: str) -> Optional[OnboardingState]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    async def record_answer(
+        self, session: OnboardingState, answer: bool
+    ) -> Optional[OnboardingState]:
+        _apply_answer(session, answer)
+        return session
+
+    async def delete(self, session_id: str) -> Optional[OnboardingState]:
+        return self._sessions.pop(session_id, None)
+
+
+# Mirrors _apply_answer server-side so concurrent answers to the same session
+# cannot overwrite each other. KEYS[1] = session key; ARGV = answer (0/1),
+# question count, TTL seconds. Returns the updated JSON, or nil if expired.
+_RECORD_ANSWER_LUA = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then return nil end
+local s = cjson.decode(raw)
+if not s.completed then
+  if ARGV[1] == '1' then
+    s.answers = s.answers + math.pow(2, s.current_question)
+  end
+  s.current_question = s.current_question + 1
+  if s.current_question >= tonumber(ARGV[2]) then s.completed = true end
+  raw = cjson.encode(s)
+  redis.call('SET', KEYS[1], raw, 'EX', ARGV[3])
+end
+return raw
+"""
 
 
-def create_session() -> OnboardingState:
+class RedisSessionStore:
+    """Session store shared by all workers, with sessions expiring after a TTL."""
+
+    def __init__(self, ttl: int = SESSION_TTL) -> None:
+        self._ttl = ttl
+        self._record_answer_script = None
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"ob:{session_id}"
+
+    async def create(self, session: OnboardingState) -> None:
+        await get_client().set(
+            self._key(session.session_id), _encode_state(session), ex=self._ttl
+        )
+
+    async def get(self, session_id: str) -> Optional[OnboardingState]:
+        raw = await get_client().get(self._key(session_id))
+        return None if raw is None else _decode_state(raw)
+
+    async def record_answer(
+        self, session: OnboardingState, answer: bool
+    ) -> Optional[OnboardingState]:
+        client = get_client()
+        if self._record_answer_script is None:
+            self._record_answer_script = client.register_script(_RECORD_ANSWER_LUA)
+        # Pass the client explicitly: it is replaced if the app restarts
+        raw = await self._record_answer_script(
+            keys=[self._key(session.session_id)],
+            args=[int(answer), len(ONBOARDING_QUESTIONS), self._ttl],
+            client=client,
+        )
+        return None if raw is None else _decode_state(raw)
+
+    async def delete(self, session_id: str) -> Optional[OnboardingState]:
+        raw = await get_client().getdel(self._key(session_id))
+        return None if raw is None else _decode_state(raw)
+
+
+_store: SessionStore = RedisSessionStore() if USE_REDIS else InMemorySessionStore()
+
+
+async def create_session() -> OnboardingState:
     """Create a new onboarding session.
 
     Returns:
         A new OnboardingState with a unique session ID.
     """
-    session_id = uuid4().hex
-    session = OnboardingState(session_id=session_id)
-    _sessions[session_id] = session
+    # 128 random bits as 32 hex chars, like uuid4().hex without the UUID object
+    session = OnboardingState(session_id=urandom(16).hex())
+    await _store.create(session)
     return session
 
 
-def get_session(session_id: str) -> Optional[OnboardingState]:
+async def get_session(session_id: str) -> Optional[OnboardingState]:
     """Get an existing onboarding session by ID.
 
     Args:
@@ -55,7 +199,7 @@ def get_session(session_id: str) -> Optional[OnboardingState]:
     Returns:
         The OnboardingState if found, None otherwise.
     """
-    return _sessions.get(session_id)
+    return await _store.get(session_id)
 
 
 def get_current_question(session: OnboardingState) -> Optional[str]:
@@ -72,105 +216,117 @@ def get_current_question(session: OnboardingState) -> Optional[str]:
     return ONBOARDING_QUESTIONS[session.current_question]
 
 
-def record_answer(session_id: str, answer: bool) -> Optional[OnboardingState]:
+async def record_answer(
+    session: OnboardingState, answer: bool
+) -> Optional[OnboardingState]:
     """Record an answer for the current question and advance to the next.
 
+    Takes the session already fetched with get_session, so answering costs a
+    single store lookup. With the Redis store the update is applied atomically
+    server-side and the stored result is returned.
+
     Args:
-        session_id: The session to update.
+        session: The session to update.
         answer: True for Y, False for N.
 
     Returns:
-        The updated OnboardingState, or None if session not found.
+        The updated OnboardingState, or None if the session expired meanwhile.
     """
-    session = _sessions.get(session_id)
-    if session is None:
-        return None
-
     if session.completed:
         return session
+    return await _store.record_answer(session, answer)
+
+
+# Profile mapping based on answer combinations (daily, deadlines, multi)
+_PROFILES: Dict[Tuple[bool, bool, bool], Dict[str, str]] = {
+    (True, True, True): {
+        "profile": "Sprint-focused Achiever",
+        "description": "You thrive with daily deadlines and enjoy juggling multiple concurrent goals. You're energized by short-term wins.",
+        "recommendation": "Set 2-3 daily goals with specific deadlines. Use a task board to visualize all active goals and celebrate small wins daily.",
+    },
+    (True, True, False): {
+        "profile": "Focused Daily Planner",
+        "description": "You work best tackling one goal at a time with clear daily deadlines. You value deep focus over breadth.",
+        "recommendation": "Focus on a single important goal each day with a specific deadline. Complete it before moving to the next.",
+    },
+    (True, False, True): {
+        "profile": "Flexible Multi-tasker",
+        "description": "You prefer daily goals but without rigid deadlines. You enjoy variety and flexibility in your approach.",
+        "recommendation": "Set 2-3 small daily goals and review progress weekly. Don't stress about exact completion times.",
+    },
+    (True, False, False): {
+        "profile": "Day-by-day Achiever",
+        "description": "You prefer a single daily focus with a flexible approach. You value simplicity and taking things one step at a time.",
+        "recommendation": "Pick one meaningful goal each morning. Focus on progress, not perfection.",
+    },
+    (False, True, True): {
+        "profile": "Strategic Project Manager",
+        "description": "You excel at long-term planning with clear milestones while tracking multiple projects simultaneously.",
+        "recommendation": "Create a roadmap with quarterly goals broken into monthly milestones. Use a project tracker for visibility.",
+    },
+    (False, True, False): {
+        "profile": "Milestone-driven Achiever",
+        "description": "You focus deeply on a single long-term goal with clear deadlines. You're driven by significant milestones.",
+        "recommendation": "Set one major goal with a clear deadline. Break it into weekly milestones and track progress consistently.",
+    },
+    (False, False, True): {
+        "profile": "Exploratory Goal-setter",
+        "description": "You prefer flexibility with multiple long-term pursuits. You value exploration and gradual progress.",
+        "recommendation": "Maintain 2-3 long-term goals and review monthly. Allow yourself to pivot as interests evolve.",
+    },
+    (False, False, False): {
+        "profile": "Deep Focus Achiever",
+        "description": "You work best with one long-term goal and a flexible timeline. You value depth over breadth.",
+        "recommendation": "Choose one meaningful long-term goal. Focus on consistent progress without pressure from deadlines.",
+    },
+}
+
+# The same profiles indexed directly by OnboardingState.answers, where bit i
+# is the answer to question i; all 8 combinations are covered. These stay
+# plain dicts (typed read-only) rather than MappingProxyType: they are placed
+# by reference into model_construct results, and pydantic-core cannot
+# serialize a mappingproxy.
+_PROFILES_BY_IDX: Tuple[Mapping[str, str], ...] = tuple(
+    _PROFILES[(bool(i & 1), bool(i & 2), bool(i & 4))] for i in range(8)
+)
+
+_INCOMPLETE_PROFILE: Mapping[str, str] = {
+    "profile": "Incomplete",
+    "description": "Please complete all questions first.",
+    "recommendation": "",
+}
+
+
+def _build_answer_summary(daily: bool, deadlines: bool, multi: bool) -> str:
+    lines = [
+        f"- You {'prefer daily goals' if daily else 'prefer long-term goals'} over {'long-term planning' if daily else 'daily tasks'}",
+        f"- You {'work better with' if deadlines else 'work better without'} strict deadlines",
+        f"- You {'like tracking multiple goals' if multi else 'prefer focusing on one goal at a time'}",
+    ]
 
-    # Record the answer
-    session.answers.append(answer)
-    session.current_question += 1
+    return "\n".join(lines)
 
-    # Check if onboarding is complete
-    if session.current_question >= len(ONBOARDING_QUESTIONS):
-        session.completed = True
 
-    return session
+# Answer summaries for every combination, indexed like _PROFILES_BY_IDX
+_ANSWER_SUMMARIES: Tuple[str, ...] = tuple(
+    _build_answer_summary(bool(i & 1), bool(i & 2), bool(i & 4)) for i in range(8)
+)
 
 
-def get_summary(session: OnboardingState) -> Dict[str, str]:
+def get_summary(session: OnboardingState) -> Mapping[str, str]:
     """Generate a personalized summary based on onboarding answers.
 
     Args:
         session: A completed onboarding session.
 
     Returns:
-        A dictionary with 'profile', 'description', and 'recommendation'.
+        A read-only mapping with 'profile', 'description', and
+        'recommendation', shared between calls without copying.
     """
-    if not session.completed or len(session.answers) != 3:
-        return {
-            "profile": "Incomplete",
-            "description": "Please complete all questions first.",
-            "recommendation": "",
-        }
-
-    # Unpack answers: Q1=daily, Q2=deadlines, Q3=multi-goals
-    daily, deadlines, multi = session.answers
-
-    # Profile mapping based on answer combinations
-    profiles = {
-        (True, True, True): {
-            "profile": "Sprint-focused Achiever",
-            "description": "You thrive with daily deadlines and enjoy juggling multiple concurrent goals. You're energized by short-term wins.",
-            "recommendation": "Set 2-3 daily goals with specific deadlines. Use a task board to visualize all active goals and celebrate small wins daily.",
-        },
-        (True, True, False): {
-            "profile": "Focused Daily Planner",
-            "description": "You work best tackling one goal at a time with clear daily deadlines. You value deep focus over breadth.",
-            "recommendation": "Focus on a single important goal each day with a specific deadline. Complete it before moving to the next.",
-        },
-        (True, False, True): {
-            "profile": "Flexible Multi-tasker",
-            "description": "You prefer daily goals but without rigid deadlines. You enjoy variety and flexibility in your approach.",
-            "recommendation": "Set 2-3 small daily goals and review progress weekly. Don't stress about exact completion times.",
-        },
-        (True, False, False): {
-            "profile": "Day-by-day Achiever",
-            "description": "You prefer a single daily focus with a flexible approach. You value simplicity and taking things one step at a time.",
-            "recommendation": "Pick one meaningful goal each morning. Focus on progress, not perfection.",
-        },
-        (False, True, True): {
-            "profile": "Strategic Project Manager",
-            "description": "You excel at long-term planning with clear milestones while tracking multiple projects simultaneously.",
-            "recommendation": "Create a roadmap with quarterly goals broken into monthly milestones. Use a project tracker for visibility.",
-        },
-        (False, True, False): {
-            "profile": "Milestone-driven Achiever",
-            "description": "You focus deeply on a single long-term goal with clear deadlines. You're driven by significant milestones.",
-            "recommendation": "Set one major goal with a clear deadline. Break it into weekly milestones and track progress consistently.",
-        },
-        (False, False, True): {
-            "profile": "Exploratory Goal-setter",
-            "description": "You prefer flexibility with multiple long-term pursuits. You value exploration and gradual progress.",
-            "recommendation": "Maintain 2-3 long-term goals and review monthly. Allow yourself to pivot as interests evolve.",
-        },
-        (False, False, False): {
-            "profile": "Deep Focus Achiever",
-            "description": "You work best with one long-term goal and a flexible timeline. You value depth over breadth.",
-            "recommendation": "Choose one meaningful long-term goal. Focus on consistent progress without pressure from deadlines.",
-        },
-    }
-
-    return profiles.get(
-        (daily, deadlines, multi),
-        {
-            "profile": "Unique Achiever",
-            "description": "Your goal-setting style is unique!",
-            "recommendation": "Experiment with different approaches to find what works best for you.",
-        },
-    )
+    if not session.completed:
+        return _INCOMPLETE_PROFILE
+
+    return _PROFILES_BY_IDX[session.answers]
 
 
 def get_answer_summary_text(session: OnboardingState) -> str:
@@ -182,21 +338,13 @@ def get_answer_summary_text(session: OnboardingState) -> str:
     Returns:
         A formatted string describing the user's answers.
     """
-    if len(session.answers) != 3:
+    if not session.completed:
         return ""
 
-    daily, deadlines, multi = session.answers
-
-    lines = [
-        f"- You {'prefer daily goals' if daily else 'prefer long-term goals'} over {'long-term planning' if daily else 'daily tasks'}",
-        f"- You {'work better with' if deadlines else 'work better without'} strict deadlines",
-        f"- You {'like tracking multiple goals' if multi else 'prefer focusing on one goal at a time'}",
-    ]
-
-    return "\n".join(lines)
+    return _ANSWER_SUMMARIES[session.answers]
 
 
-def clear_session(session_id: str) -> Optional[OnboardingState]:
+async def clear_session(session_id: str) -> Optional[OnboardingState]:
     """Remove a session from the store.
 
     Args:
@@ -205,4 +353,4 @@ def clear_session(session_id: str) -> Optional[OnboardingState]:
     Returns:
         The removed session, or None if not found.
     """
-    return _sessions.pop(session_id, None)
+    return await _store.delete(session_id)
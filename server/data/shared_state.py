@@ -0,0 +1,75 @@
+"""Redis-backed storage shared by every worker process.
+
+With ``STATE_BACKEND=redis`` the goal state persists through the JSON
+helpers here and the onboarding RedisSessionStore uses the shared client
+directly, so a request can be served by any worker behind the load
+balancer. The default ``memory`` backend never touches this module's
+client, and the ``redis`` package is only imported when it is actually used.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import orjson
+
+from server.config import REDIS_URL, STATE_BACKEND
+
+USE_REDIS = STATE_BACKEND == "redis"
+
+_client = None
+
+
+async def connect() -> None:
+    """Create the process-wide async Redis client and check it is reachable.
+
+    Called from the app lifespan, so a missing ``redis`` package or an
+    unreachable server fails startup instead of every later state call.
+    """
+    global _client
+    try:
+        from redis.asyncio import Redis
+    except ImportError as e:
+        raise RuntimeError(
+            "STATE_BACKEND=redis requires the 'redis' package "
+            "(install goals-py[redis])."
+        ) from e
+    client = Redis.from_url(REDIS_URL)
+    try:
+        await client.ping()
+    except BaseException:
+        await client.aclose()
+        raise
+    _client = client
+
+
+async def close() -> None:
+    """Close the Redis client opened by connect(), if any."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def get_client():
+    """Return the process-wide async Redis client opened by connect()."""
+    if _client is None:
+        raise RuntimeError("Redis client is not connected; call connect() first.")
+    return _client
+
+
+async def load_json(key: str) -> Optional[Any]:
+    """Fetch and decode a JSON value, or None if the key is missing."""
+    raw = await get_client().get(key)
+    return None if raw is None else orjson.loads(raw)
+
+
+async def store_json(key: str, value: Any) -> None:
+    """Encode and store a JSON value."""
+    await get_client().set(key, orjson.dumps(value))
+
+
+async def pop_json(key: str) -> Optional[Any]:
+    """Atomically fetch and delete a JSON value, or None if the key is missing."""
+    raw = await get_client().getdel(key)
+    return None if raw is None else orjson.loads(raw)
@@ -1,18 +1,37 @@
+"""Goal state.
+
+Held in a module global by default, or in Redis when ``STATE_BACKEND=redis``
+so every worker sees the same goal. The in-memory path does no I/O, and the
+Redis path awaits an async client, so the async goal tools call these
+directly on the event loop.
+"""
+
+from server.data.shared_state import USE_REDIS, load_json, pop_json, store_json
+
+_GOAL_KEY = "goal"
+
 goal: dict | None = None
 
 
-def get_goal() -> dict | None:
+async def get_goal() -> dict | None:
+    if USE_REDIS:
+        return await load_json(_GOAL_KEY)
     return goal
 
 
-def set_goal(next_goal: dict) -> dict:
+async def set_goal(next_goal: dict) -> dict:
     global goal
+    if USE_REDIS:
+        await store_json(_GOAL_KEY, next_goal)
+        return next_goal
     goal = next_goal
     return goal
 
 
-def clear_goal() -> dict | None:
+async def clear_goal() -> dict | None:
     global goal
+    if USE_REDIS:
+        return await pop_json(_GOAL_KEY)
     current = goal
     goal = None
     return current
@@ -1,9 +1,28 @@
+import sys
+
 import uvicorn
 
 from server.app import create_app
-from server.config import PORT
+from server.config import PORT, WORKERS
 
 app = create_app()
 
+
+def main() -> None:
+    options = {
+        "host": "0.0.0.0",
+        "port": PORT,
+        # uvloop has no Windows build; fall back to the stdlib loop there
+        "loop": "asyncio" if sys.platform in ("win32", "cygwin") else "uvloop",
+        "http": "httptools",
+    }
+    if WORKERS > 1:
+        # Worker processes need an import string so each builds its own app
+        uvicorn.run("server.main:app", workers=WORKERS, **options)
+    else:
+        # Serve the app built above rather than importing this module again
+        uvicorn.run(app, **options)
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
+    main()
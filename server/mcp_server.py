@@ -7,27 +7,26 @@ widget UI that renders inline in ChatGPT conversations.
 from __future__ import annotations
 
 import os
-from typing import List
+from functools import cache
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 
+from server.config import split_env_list
 from server.resources.templates import register_resources
-from server.tools.goals import register_goal_tools
-from server.tools.onboarding import register_onboarding_tools
-
-
-def _split_env_list(value: str | None) -> List[str]:
-    """Split comma-separated environment variable into list."""
-    if not value:
-        return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+from server.tools.goals import goal_tools
+from server.tools.onboarding import onboarding_tools
 
 
+@cache
 def _transport_security_settings() -> TransportSecuritySettings:
-    """Configure transport security based on environment variables."""
-    allowed_hosts = _split_env_list(os.getenv("MCP_ALLOWED_HOSTS"))
-    allowed_origins = _split_env_list(os.getenv("MCP_ALLOWED_ORIGINS"))
+    """Configure transport security based on environment variables.
+
+    The environment is fixed for the life of the process, so this is only
+    computed once.
+    """
+    allowed_hosts = split_env_list(os.getenv("MCP_ALLOWED_HOSTS"))
+    allowed_origins = split_env_list(os.getenv("MCP_ALLOWED_ORIGINS"))
     if not allowed_hosts and not allowed_origins:
         return TransportSecuritySettings(enable_dns_rebinding_protection=False)
     return TransportSecuritySettings(
@@ -43,11 +42,10 @@ def create_mcp_server() -> FastMCP:
         name="chatgpt-apps-sdk-demo",
         stateless_http=True,
         transport_security=_transport_security_settings(),
+        tools=[*goal_tools(), *onboarding_tools()],
     )
 
-    # Register all tools and resources
+    # Register resources
     register_resources(mcp)
-    register_goal_tools(mcp)
-    register_onboarding_tools(mcp)
 
     return mcp
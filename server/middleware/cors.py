@@ -1,12 +1,15 @@
+from typing import List
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 
-def add_cors(app: FastAPI) -> None:
+def add_cors(app: FastAPI, origins: List[str]) -> None:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
+        allow_origins=origins,
+        # Everything the MCP streamable HTTP transport uses
+        allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
         allow_headers=["*"],
         expose_headers=["Mcp-Session-Id"],
     )
@@ -5,18 +5,20 @@ This package contains resource registration and template utilities.
 
 from server.resources.templates import (
     CALENDAR_TEMPLATE_URI,
+    CALENDAR_WIDGET_PATH,
     MIME_TYPE,
     WIDGET_DIR,
+    WIDGET_META,
     load_calendar_widget_html,
     register_resources,
-    widget_meta,
 )
 
 __all__ = [
     "CALENDAR_TEMPLATE_URI",
+    "CALENDAR_WIDGET_PATH",
     "MIME_TYPE",
     "WIDGET_DIR",
+    "WIDGET_META",
     "load_calendar_widget_html",
     "register_resources",
-    "widget_meta",
 ]
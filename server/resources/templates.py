@@ -2,31 +2,35 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
-# Widget configuration
-WIDGET_DIR = Path(__file__).resolve().parent.parent.parent / "public"
+# Widget configuration (absolute() avoids resolve()'s per-component stat calls)
+WIDGET_DIR = Path(__file__).absolute().parent.parent.parent / "public"
+CALENDAR_WIDGET_PATH = WIDGET_DIR / "calendar-widget.html"
 CALENDAR_TEMPLATE_URI = "ui://widget/calendar-widget.html"
 MIME_TYPE = "text/html+skybridge"
 
+# Standard meta for widget-backed tools (used in tool listing and results).
+# Tool results are built with model_construct, which stores this exact dict
+# on every response, so it must be a plain dict and must never be mutated.
+WIDGET_META: dict[str, Any] = {
+    "openai/outputTemplate": CALENDAR_TEMPLATE_URI,
+    "openai/toolInvocation/invoking": "Preparing widget",
+    "openai/toolInvocation/invoked": "Widget rendered",
+    "openai/widgetAccessible": True,
+}
 
-@lru_cache(maxsize=1)
-def load_calendar_widget_html() -> str:
-    """Load and cache the calendar widget HTML."""
-    return (WIDGET_DIR / "calendar-widget.html").read_text(encoding="utf-8")
+
+# The widget is static, so read it once at import rather than per request
+_CALENDAR_WIDGET_HTML = CALENDAR_WIDGET_PATH.read_text(encoding="utf-8")
 
 
-def widget_meta() -> dict:
-    """Standard meta for widget-backed tools (used in tool listing and results)."""
-    return {
-        "openai/outputTemplate": CALENDAR_TEMPLATE_URI,
-        "openai/toolInvocation/invoking": "Preparing widget",
-        "openai/toolInvocation/invoked": "Widget rendered",
-        "openai/widgetAccessible": True,
-    }
+def load_calendar_widget_html() -> str:
+    """Return the calendar widget HTML."""
+    return _CALENDAR_WIDGET_HTML
 
 
 def register_resources(mcp: FastMCP) -> None:
@@ -39,4 +43,4 @@ def register_resources(mcp: FastMCP) -> None:
     )
     async def calendar_widget() -> str:
         """Returns the calendar widget HTML for goal tracking."""
-        return load_calendar_widget_html()
+        return _CALENDAR_WIDGET_HTML
@@ -1 +1,5 @@
 """FastAPI routes package."""
+
+from server.routes.widget import add_widget_route
+
+__all__ = ["add_widget_route"]
@@ -0,0 +1,20 @@
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import FileResponse
+
+from server.resources.templates import CALENDAR_WIDGET_PATH
+
+
+async def widget(request: Request) -> FileResponse:
+    """Serve the raw widget HTML straight from disk.
+
+    FileResponse streams the file with ``os.sendfile`` where available, so the
+    HTML never passes through a Python ``str``. Building it does no blocking
+    I/O, so the endpoint is async and stays off the threadpool.
+    """
+    return FileResponse(CALENDAR_WIDGET_PATH, media_type="text/html")
+
+
+def add_widget_route(app: FastAPI) -> None:
+    """Register the plain Starlette /widget route."""
+    app.add_route("/widget", widget, methods=["GET"], include_in_schema=False)
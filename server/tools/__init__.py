@@ -1,13 +1,14 @@
 """MCP tools package.
 
-This package contains modular tool registration functions for the MCP server.
-Each module focuses on a specific domain of functionality.
+This package contains modular tool definitions for the MCP server.
+Each module focuses on a specific domain of functionality and exposes its
+tools as prebuilt ``Tool`` objects.
 """
 
-from server.tools.goals import register_goal_tools
-from server.tools.onboarding import register_onboarding_tools
+from server.tools.goals import goal_tools
+from server.tools.onboarding import onboarding_tools
 
 __all__ = [
-    "register_goal_tools",
-    "register_onboarding_tools",
+    "goal_tools",
+    "onboarding_tools",
 ]
@@ -0,0 +1,30 @@
+"""_parse_date accepts only YYYY-MM-DD dates."""
+
+from datetime import date
+
+import pytest
+
+from server.tools.goals import _parse_date
+
+
+def test_parse_date_accepts_iso_date():
+    assert _parse_date("2030-01-01") == date(2030, 1, 1)
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        # Accepted by date.fromisoformat on 3.11+, rejected by the pattern
+        ("20300101", "expected YYYY-MM-DD, got '20300101'"),
+        ("2030-W01-1", "expected YYYY-MM-DD, got '2030-W01-1'"),
+        # Arabic-Indic digits match \d but not [0-9]
+        ("٢٠٣٠-٠١-٠١", "expected YYYY-MM-DD, got '٢٠٣٠-٠١-٠١'"),
+        # Well-formed but impossible, so rejected by fromisoformat itself
+        ("2030-02-30", "day is out of range for month"),
+    ],
+)
+def test_parse_date_rejects_invalid(value, message):
+    with pytest.raises(ValueError) as excinfo:
+        _parse_date(value)
+
+    assert str(excinfo.value) == message
@@ -0,0 +1,79 @@
+"""Both session stores must apply onboarding answers identically.
+
+RedisSessionStore re-implements the answer state machine in Lua, so run the
+same answers through each store and compare the results.
+"""
+
+import asyncio
+
+import pytest
+
+from server.data import shared_state
+from server.data.onboarding_state import (
+    InMemorySessionStore,
+    OnboardingState,
+    RedisSessionStore,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+async def _answer(store, answers):
+    await store.create(OnboardingState(session_id="s1"))
+    for answer in answers:
+        session = await store.record_answer(await store.get("s1"), answer)
+    return session
+
+
+def _run_redis(monkeypatch, answers):
+    async def run():
+        monkeypatch.setattr(shared_state, "_client", fakeredis.FakeAsyncRedis())
+        session = await _answer(RedisSessionStore(), answers)
+        # The stored copy must match what the script returned
+        return session, await RedisSessionStore().get("s1")
+
+    return asyncio.run(run())
+
+
+def test_in_memory_store_records_answers():
+    session = asyncio.run(_answer(InMemorySessionStore(), (True, False, True)))
+
+    assert session.answers == 5
+    assert session.current_question == 3
+    assert session.completed is True
+
+
+def test_in_memory_store_evicts_least_recently_used():
+    async def run():
+        store = InMemorySessionStore(2)
+        await store.create(OnboardingState(session_id="a"))
+        await store.create(OnboardingState(session_id="b"))
+        await store.get("a")  # touching "a" leaves "b" as the oldest
+        await store.create(OnboardingState(session_id="c"))
+        return [await store.get(session_id) for session_id in ("a", "b", "c")]
+
+    a, b, c = asyncio.run(run())
+
+    assert b is None
+    assert a is not None and a.session_id == "a"
+    assert c is not None and c.session_id == "c"
+
+
+def test_redis_store_records_answers(monkeypatch):
+    session, stored = _run_redis(monkeypatch, (True, False, True))
+
+    assert session.answers == 5
+    assert session.current_question == 3
+    assert session.completed is True
+    assert stored == session
+
+
+@pytest.mark.parametrize(
+    "answers",
+    [(True,), (False, True), (True, True, True), (False, False, False, True)],
+)
+def test_stores_agree(monkeypatch, answers):
+    in_memory = asyncio.run(_answer(InMemorySessionStore(), answers))
+    redis_session, _ = _run_redis(monkeypatch, answers)
+
+    assert redis_session == in_memory